@@ -0,0 +1,104 @@
+import os
+import json
+import hashlib
+import tempfile
+import zipfile
+import numpy as np
+
+# Environment variable naming the directory where processed point clouds are cached.
+CACHE_DIR_ENV = "PYFORESTSCAN_CACHE_DIR"
+
+
+def _file_signature(path):
+    """
+    Describe a file by its absolute path, modification time and size.
+
+    Args:
+        path (str): Path to the file.
+
+    Returns:
+        list: The absolute path, modification time in nanoseconds and size in bytes.
+
+    Example:
+        >>> _file_signature("path/to/pointcloud.las")
+        ['/abs/path/to/pointcloud.las', 1700000000000000000, 123456]
+    """
+    stat = os.stat(path)
+    return [os.path.abspath(path), stat.st_mtime_ns, stat.st_size]
+
+
+def _cache_key(input_file, pipeline_stages):
+    """
+    Compute the cache key for running the given pipeline stages on a point cloud file.
+
+    The key changes whenever the input file, or any file referenced by a stage such as a DTM raster,
+    is modified, or when any stage option changes.
+
+    Args:
+        input_file (str): Path to the point cloud file.
+        pipeline_stages (list): PDAL pipeline stages used to read and process the file.
+
+    Returns:
+        str: Hexadecimal SHA-256 digest identifying the pipeline result.
+
+    Example:
+        >>> _cache_key("path/to/pointcloud.las", ["path/to/pointcloud.las", {"type": "filters.sample", "radius": 1.5}])
+        '3f2a...'
+    """
+    referenced_files = [
+        _file_signature(value)
+        for stage in pipeline_stages
+        for value in (stage.values() if isinstance(stage, dict) else [stage])
+        if isinstance(value, str) and os.path.isfile(value)
+    ]
+    key_source = json.dumps([_file_signature(input_file), referenced_files, pipeline_stages], sort_keys=True)
+    return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+
+def cached_pipeline(input_file, pipeline_stages, run_pipeline, cache_dir=None):
+    """
+    Return the arrays produced by a point cloud pipeline, reusing a result previously stored on disk.
+
+    Results are stored as .npz files in `cache_dir`, or in the directory named by the PYFORESTSCAN_CACHE_DIR
+    environment variable. If neither is set, the pipeline is always run and nothing is cached. Cache entries that
+    cannot be read, e.g. after an interrupted write, are treated as missing and written again.
+
+    Args:
+        input_file (str): Path to the point cloud file.
+        pipeline_stages (list): PDAL pipeline stages used to read and process the file.
+        run_pipeline (callable): Function without arguments that runs the pipeline and returns its list of arrays.
+        cache_dir (str, optional): Directory for cached results. Defaults to None.
+
+    Returns:
+        list: List of NumPy arrays containing the processed point cloud data.
+
+    Example:
+        >>> cached_pipeline("path/to/pointcloud.las", stages, lambda: _read_point_cloud(stages).arrays)
+    """
+    cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV)
+    if not cache_dir:
+        return run_pipeline()
+
+    cache_path = os.path.join(cache_dir, _cache_key(input_file, pipeline_stages) + ".npz")
+    if os.path.isfile(cache_path):
+        try:
+            with np.load(cache_path) as cached:
+                return [cached[f"arr_{i}"] for i in range(len(cached.files))]
+        except (OSError, ValueError, EOFError, zipfile.BadZipFile):
+            pass
+
+    arrays = run_pipeline()
+    if arrays:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write under a unique temporary name first so concurrent readers never see a partial file and
+        # concurrent writers, in other processes or threads, never write to the same file.
+        with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".tmp.npz", delete=False) as temp_file:
+            temp_path = temp_file.name
+            try:
+                np.savez(temp_file, *arrays)
+            except BaseException:
+                temp_file.close()
+                os.remove(temp_path)
+                raise
+        os.replace(temp_path, cache_path)
+    return arrays
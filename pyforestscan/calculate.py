@@ -1,43 +1,168 @@
-import pandas as pd
 import numpy as np
 
+# Target working-set size for one block of voxel columns in calculate_lad.
+_LAD_BLOCK_BYTES = 256 * 1024
+
+
+def arrays_to_soa(arr, fields=('X', 'Y', 'HeightAboveGround')):
+    """
+    Converts the selected fields of a point cloud into contiguous 1D arrays.
+
+    PDAL returns points as structured arrays, so every field access strides over the full point record.
+    Gathering the needed fields once lets repeated numeric passes read packed arrays instead.
+
+    Args:
+        arr (np.ndarray or dict): Structured point cloud array, or a mapping of field names to 1D arrays.
+        fields (tuple, optional): Names of the fields to extract. Defaults to ('X', 'Y', 'HeightAboveGround'),
+            the fields used by `assign_voxels`.
+
+    Returns:
+        dict: A dictionary mapping each field name to a contiguous 1D array.
+
+    Example:
+        >>> points = arrays_to_soa(arrays[0])
+        >>> histogram, extent = assign_voxels(points, 1, 1)
+    """
+    return {field: np.ascontiguousarray(arr[field]) for field in fields}
+
+
+def xyz_view(arr):
+    """
+    Returns the X, Y and Z fields of a structured point cloud array as an (N, 3) float64 array.
+
+    When X, Y and Z are adjacent float64 fields, as in the arrays returned by PDAL, the result is a strided view
+    into `arr` and no point data is copied. Otherwise the fields are copied into a new array.
+
+    Args:
+        arr (np.ndarray): Structured NumPy array containing point cloud data with fields 'X', 'Y' and 'Z'.
+
+    Returns:
+        np.ndarray: Array of shape (N, 3) holding the X, Y and Z coordinates of each point. If it is a view,
+            writing to it modifies `arr`.
+
+    Example:
+        >>> xyz = xyz_view(arrays[0])
+        >>> xyz.shape
+        (1000, 3)
+    """
+    fields = arr.dtype.fields
+    x_dtype, x_offset = fields['X'][:2]
+    y_dtype, y_offset = fields['Y'][:2]
+    z_dtype, z_offset = fields['Z'][:2]
+
+    float64 = np.dtype(np.float64)
+    if (arr.ndim == 1 and arr.size and arr.flags.c_contiguous and x_dtype == float64 and y_dtype == float64
+            and z_dtype == float64 and y_offset == x_offset + 8 and z_offset == x_offset + 16):
+        return np.ndarray((arr.size, 3), dtype=float64, buffer=arr, offset=x_offset, strides=(arr.itemsize, 8))
+
+    return np.column_stack((arr['X'], arr['Y'], arr['Z'])).astype(np.float64, copy=False)
+
+
+def _bin_index(values, v_min, resolution, n_bins):
+    """
+    Computes the index of the uniform bin each value falls into.
+
+    Values lying exactly on a bin edge go to the upper bin, as with `np.histogramdd` over edges built by
+    `np.arange(v_min, v_max + resolution, resolution)`. Dividing by the resolution alone can round such values
+    down, e.g. (2.3 - 0.3) / 1 gives 1.9999999999999998.
+
+    Args:
+        values (np.ndarray): Values to bin.
+        v_min (float): Lower edge of the first bin.
+        resolution (float): Width of each bin.
+        n_bins (int): Number of bins. Values beyond the last bin are placed in it.
+
+    Returns:
+        np.ndarray: Bin index of each value.
+
+    Example:
+        >>> _bin_index(np.array([0.3, 1.3, 2.3]), 0.3, 1, 3)
+        array([0, 1, 2])
+    """
+    # np.arange steps by the rounded difference between its first two values rather than by the resolution.
+    step = (v_min + resolution) - v_min
+    idx = np.floor((values - v_min) / step).astype(np.intp)
+    idx += values >= v_min + (idx + 1) * step
+    idx -= values < v_min + idx * step
+    return np.clip(idx, 0, n_bins - 1)
+
+
+def _assign_voxels_soa(x, y, z, voxel_resolution, z_resolution):
+    """
+    Assigns voxel bins to point coordinates given as separate contiguous 1D arrays.
+
+    Args:
+        x (np.ndarray): X coordinates of the points.
+        y (np.ndarray): Y coordinates of the points.
+        z (np.ndarray): Height above ground of the points.
+        voxel_resolution (float): The spatial resolution of the voxel grid in the x and y dimensions.
+        z_resolution (float): The spatial resolution of the voxel grid in the z dimension.
+
+    Returns:
+        tuple: The 3D int32 histogram and the [xmin, xmax, ymin, ymax] extent, as returned by `assign_voxels`.
+
+    Raises:
+        ValueError: If no points are given.
+
+    Example:
+        >>> histogram, extent = _assign_voxels_soa(x, y, z, 1, 1)
+    """
+    if x.size == 0:
+        raise ValueError("The input array contains no points.")
+
+    x_min, x_max = x.min(), x.max()
+    y_min, y_max = y.min(), y.max()
+    z_min, z_max = z.min(), z.max()
+
+    # Bin counts come straight from the ranges; building edges with np.arange can gain or lose a bin to rounding.
+    nx = max(int(np.ceil((x_max - x_min) / voxel_resolution)), 1)
+    ny = max(int(np.ceil((y_max - y_min) / voxel_resolution)), 1)
+    nz = max(int(np.ceil((z_max - z_min) / z_resolution)), 1)
+
+    # Bins are uniform, so voxel indices are computed directly instead of searching the bin edges.
+    x_idx = _bin_index(x, x_min, voxel_resolution, nx)
+    y_idx = _bin_index(y, y_min, voxel_resolution, ny)
+    z_idx = _bin_index(z, z_min, z_resolution, nz)
+
+    voxel_idx = np.ravel_multi_index((x_idx, y_idx, z_idx), (nx, ny, nz))
+    histogram = np.bincount(voxel_idx, minlength=nx * ny * nz).reshape(nx, ny, nz).astype(np.int32)
+    extent = [x_min, x_max, y_min, y_max]
+
+    return histogram, extent
+
 
 def assign_voxels(arr, voxel_resolution, z_resolution):
     """
     Assigns voxel bins to 3D point cloud data.
 
     Args:
-        arr (np.ndarray): The input array containing 3D point cloud data with fields 'X', 'Y', and 'HeightAboveGround'.
+        arr (np.ndarray or dict): The input array containing 3D point cloud data with fields 'X', 'Y', and
+            'HeightAboveGround', or the equivalent mapping of field names to 1D arrays as returned by
+            `arrays_to_soa`.
         voxel_resolution (float): The spatial resolution of the voxel grid in the x and y dimensions.
         z_resolution (float): The spatial resolution of the voxel grid in the z dimension.
 
     Returns:
         tuple: A tuple containing the following:
-            - histogram (np.ndarray): 3D histogram array showing the density of points in each voxel.
+            - histogram (np.ndarray): 3D int32 histogram array holding the number of points in each voxel.
             - extent (list): The minimum and maximum coordinates for x and y in the format [xmin, xmax, ymin, ymax].
 
+    Raises:
+        ValueError: If the input array contains no points.
+
     Example:
         >>> arr = np.array([(1, 2, 3), (2, 3, 4), (3, 4, 5)], dtype=[('X', 'f4'), ('Y', 'f4'), ('HeightAboveGround', 'f4')])
         >>> assign_voxels(arr, 1, 1)
-        (array([[[0., 1.],
-                 [0., 0.]],
-                [[0., 0.],
-                 [0., 0.]]]), [1.0, 3.0, 2.0, 4.0])
+        (array([[[1, 0],
+                 [0, 0]],
+                [[0, 0],
+                 [0, 2]]], dtype=int32), [1.0, 3.0, 2.0, 4.0])
     """
-    laz_df = pd.DataFrame(arr)
+    points = arrays_to_soa(arr)
+    return _assign_voxels_soa(points['X'], points['Y'], points['HeightAboveGround'], voxel_resolution, z_resolution)
 
-    x_bin = np.arange(laz_df['X'].min(), laz_df['X'].max() + voxel_resolution, voxel_resolution)
-    y_bin = np.arange(laz_df['Y'].min(), laz_df['Y'].max() + voxel_resolution, voxel_resolution)
-    z_bin = np.arange(laz_df['HeightAboveGround'].min(), laz_df['HeightAboveGround'].max() + z_resolution, z_resolution)
 
-    histogram, edges = np.histogramdd(np.vstack((arr['X'], arr['Y'], arr['HeightAboveGround'])).transpose(),
-                                      bins=(x_bin, y_bin, z_bin))
-    extent = [arr['X'].min(), arr['X'].max(), arr['Y'].min(), arr['Y'].max()]
-
-    return histogram, extent
-
-
-def calculate_lad(voxel_returns, voxel_height, beer_lambert_constant=None):
+def calculate_lad(voxel_returns, voxel_height, beer_lambert_constant=None, dtype=np.float32, out=None):
     """
     Calculates the Leaf Area Density (LAD) using voxelized return data.
 
@@ -45,9 +170,17 @@ def calculate_lad(voxel_returns, voxel_height, beer_lambert_constant=None):
         voxel_returns (np.ndarray): 3D array where each element indicates the number of returns for that voxel.
         voxel_height (float): The height of each voxel.
         beer_lambert_constant (float, optional): The Beer-Lambert extinction coefficient. Defaults to 1.
+        dtype (np.dtype, optional): Floating point type used for the computation and the result. Defaults to np.float32.
+        out (np.ndarray, optional): Preallocated array with the shape of `voxel_returns` to write the result into,
+            e.g. to reuse one buffer across many equally sized tiles. Must be C-contiguous and of a floating point
+            type, which overrides `dtype`. Defaults to None.
 
     Returns:
-        np.ndarray: 3D array containing the Leaf Area Density (LAD) for each voxel.
+        np.ndarray: 3D array of `dtype` containing the Leaf Area Density (LAD) for each voxel.
+
+    Raises:
+        ValueError: If `dtype` is not a floating point type, or if `out` does not match the shape of
+            `voxel_returns`, is not of a floating point type, is not C-contiguous or overlaps `voxel_returns`.
 
     Example:
         >>> voxel_returns = np.array([[[1, 2], [3, 4]], [[5, 6], [7, 8]]])
@@ -55,37 +188,68 @@ def calculate_lad(voxel_returns, voxel_height, beer_lambert_constant=None):
         array([[[...], [...]],
                [[...], [...]]])
     """
-    return_accum = np.cumsum(voxel_returns[::-1], axis=2)[::-1]
-    shots_in = return_accum
-    shots_through = return_accum - voxel_returns
-
-    division_result = np.divide(shots_in, shots_through, out=np.full(shots_in.shape, np.nan),
-                                where=~np.isnan(shots_through))
+    if out is not None:
+        if not np.issubdtype(out.dtype, np.floating):
+            raise ValueError("The output array must have a floating point dtype.")
+        if not out.flags.c_contiguous:
+            raise ValueError("The output array must be C-contiguous.")
+        dtype = out.dtype
+    elif not np.issubdtype(dtype, np.floating):
+        raise ValueError("The LAD dtype must be a floating point type.")
+    # Returns are kept in their own type, usually the int32 counts from assign_voxels, and cast one block at a
+    # time so no full-size floating point copy of the grid is made.
+    voxel_returns = np.ascontiguousarray(voxel_returns)
+    if out is not None:
+        if out.shape != voxel_returns.shape:
+            raise ValueError("The output array must have the same shape as the voxel returns.")
+        # The returns are still read after the cumulative sum has been written to the output.
+        if np.shares_memory(out, voxel_returns):
+            raise ValueError("The output array must not share memory with the voxel returns.")
+    lad = np.empty(voxel_returns.shape, dtype=dtype) if out is None else out
 
     k = beer_lambert_constant if beer_lambert_constant else 1
     dz = voxel_height
-
-    lad = np.log(division_result) * (1 / (k * dz))
-
-    lad = np.where(np.isinf(lad) | np.isnan(lad), np.nan, lad)
+    scale = 1 / (k * dz)
+
+    # Work through blocks of z-columns small enough to stay in cache across the cumsum, ratio, log and masking
+    # steps, so each block is read from memory once instead of once per step.
+    nx, ny, nz = voxel_returns.shape
+    columns = voxel_returns.reshape(nx * ny, nz)
+    lad_columns = lad.reshape(nx * ny, nz)
+    block = max(_LAD_BLOCK_BYTES // max(nz * max(columns.itemsize, lad.itemsize), 1), 1)
+    shots_through = np.empty((min(block, nx * ny), nz), dtype=lad.dtype)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for start in range(0, nx * ny, block):
+            returns = columns[start:start + block]
+            shots_in = np.cumsum(returns, axis=1, dtype=lad.dtype, out=lad_columns[start:start + block])
+            through = np.subtract(shots_in, returns, out=shots_through[:len(returns)])
+
+            np.divide(shots_in, through, out=shots_in)
+            np.log(shots_in, out=shots_in)
+            shots_in *= scale
+            shots_in[~np.isfinite(shots_in)] = np.nan
 
     return lad
 
 
-def calculate_lai(lad):
+def calculate_lai(lad, dtype=None):
     """
     Calculates the Leaf Area Index (LAI) from the Leaf Area Density (LAD).
 
     Args:
         lad (np.ndarray): 3D array containing the Leaf Area Density (LAD) for each voxel.
+        dtype (np.dtype, optional): Floating point type used to accumulate the sum. Defaults to None, which uses
+            the data type of `lad`.
 
     Returns:
-        np.ndarray: 2D array containing the Leaf Area Index (LAI) for each x, y coordinate.
+        np.ndarray: 2D array of `dtype` containing the Leaf Area Index (LAI) for each x, y coordinate.
 
     Example:
-        >>> lad = np.array([[[1, 2], [3, 4]], [[5, 6], [7, 8]]])
+        >>> lad = np.array([[[1, 2], [3, 4]], [[5, 6], [7, 8]]], dtype=np.float32)
         >>> calculate_lai(lad)
-        array([[6, 8],
-               [12, 16]])
+        array([[ 3.,  7.],
+               [11., 15.]], dtype=float32)
     """
-    return np.nansum(lad, axis=2)
+    lad = np.asarray(lad)
+    return np.nansum(lad, axis=2, dtype=lad.dtype if dtype is None else dtype)
@@ -1,19 +1,56 @@
 import os
-import json
+import struct
+import numpy as np
 import rasterio
 import pdal
 import geopandas as gpd
 
+from collections.abc import Hashable
+from functools import lru_cache
+from pathlib import PurePath
 from pyproj import CRS
-from shapely.geometry import MultiPolygon
+from shapely import wkt
+from shapely.geometry import MultiPolygon, box
 
-from pyforestscan.pipeline import _crop_polygon, _filter_radius, _hag_delaunay, _hag_raster
+from pyforestscan.cache import cached_pipeline
+from pyforestscan.pipeline import (_crop_bounds, _crop_polygon, _filter_radius, _hag_delaunay, _hag_raster,
+                                   _pdal_bounds)
+
+# Tile size, in pixels, of the GeoTIFFs written by create_geotiff.
+_GEOTIFF_BLOCK_SIZE = 256
+
+# PDAL reader used for each supported point cloud file extension.
+_READER_BY_EXTENSION = {
+    '.las': 'readers.las',
+    '.laz': 'readers.las',
+    '.copc.laz': 'readers.copc',
+}
+
+
+@lru_cache(maxsize=64)
+def _crs_to_epsg(crs):
+    """
+    Convert a CRS representation to its EPSG code, caching the result per input.
+
+    Args:
+        crs (str): Coordinate Reference System representation, e.g. an authority string or WKT.
+
+    Returns:
+        int: The matching EPSG code, or None if there is no match.
+
+    Example:
+        >>> _crs_to_epsg("WGS84")
+        4326
+    """
+    return CRS(crs).to_epsg()
 
 
 def simplify_crs(crs_list):
     """
     Converts a list of CRS representations to their corresponding EPSG codes.
 
+    Lookups are cached per representation; unhashable inputs such as PROJJSON dictionaries are parsed every time.
+
     Args:
         crs_list (list): List of Coordinate Reference Systems to be simplified.
 
@@ -24,7 +61,7 @@ def simplify_crs(crs_list):
         >>> simplify_crs(["EPSG:4326", "WGS84"])
         [4326, 4326]
     """
-    return [CRS(crs).to_epsg() for crs in crs_list]
+    return [_crs_to_epsg(crs) if isinstance(crs, Hashable) else CRS(crs).to_epsg() for crs in crs_list]
 
 
 def load_polygon_from_file(vector_file_path, index=0):
@@ -41,6 +78,7 @@ def load_polygon_from_file(vector_file_path, index=0):
     Raises:
         FileNotFoundError: If the given vector file does not exist.
         ValueError: If the file format is not supported.
+        IndexError: If the file has no geometry at the given index.
 
     Example:
         >>> load_polygon_from_file("path/to/file.shp")
@@ -49,12 +87,19 @@ def load_polygon_from_file(vector_file_path, index=0):
     if not os.path.isfile(vector_file_path):
         raise FileNotFoundError(f"No such file: '{vector_file_path}'")
 
+    if index < 0:
+        raise IndexError(f"Geometry index must be non-negative, got {index}.")
+
+    # Only the requested feature is read, rather than the whole file and its attribute table.
     try:
-        gdf = gpd.read_file(vector_file_path)
+        gdf = gpd.read_file(vector_file_path, rows=slice(index, index + 1))
     except Exception as e:
         raise ValueError(f"Unable to read file: {vector_file_path}. Ensure it is a valid vector file format.") from e
 
-    polygon = gdf.loc[index, 'geometry']
+    if gdf.empty:
+        raise IndexError(f"No geometry at index {index} in '{vector_file_path}'.")
+
+    polygon = gdf.geometry.iloc[0]
     if isinstance(polygon, MultiPolygon):
         polygon = list(polygon.geoms)[0]
     return polygon.wkt, gdf.crs.to_string()
@@ -97,38 +142,152 @@ def validate_extensions(las_file_path, dtm_file_path):
     Example:
         >>> validate_extensions("pointcloud.las", "dtm.tif")
     """
-    if not las_file_path.lower().endswith(('.las', '.laz')):
-        raise ValueError("The point cloud file must be a .las or .laz file.")
+    if _reader_from_extension(las_file_path) is None:
+        raise ValueError("The point cloud file must be a .las, .laz or .copc.laz file.")
     if not dtm_file_path.lower().endswith('.tif'):
         raise ValueError("The DTM file must be a .tif file.")
 
 
-def _read_point_cloud(input_file, pipeline_stages=None):
+def _reader_from_header(input_file):
     """
-    Read a point cloud file using a PDAL pipeline.
+    Determine the PDAL reader for a LAS file by inspecting its header.
+
+    The COPC specification requires the 'copc' info VLR (record ID 1) to be the first VLR after the header,
+    so only a few hundred bytes are read. The result is not cached, since a file may be rewritten in place.
 
     Args:
         input_file (str): Path to the point cloud file.
-        pipeline_stages (list, optional): Additional PDAL pipeline stages to be appended.
 
     Returns:
-        pdal.Pipeline: PDAL Pipeline object containing the point cloud data.
+        str: 'readers.copc' for Cloud Optimized Point Cloud (COPC) files, 'readers.las' for other LAS files,
+            or None if the file cannot be read or has no LAS header.
 
-    Raises:
-        FileNotFoundError: If the given point cloud file does not exist.
+    Example:
+        >>> _reader_from_header("path/to/pointcloud.laz")
+        'readers.copc'
+    """
+    try:
+        with open(input_file, 'rb') as f:
+            header = f.read(96)
+            if len(header) < 96 or header[:4] != b'LASF':
+                return None
+            header_size, = struct.unpack_from('<H', header, 94)
+            f.seek(header_size)
+            vlr_header = f.read(20)
+    except OSError:
+        return None
+
+    if len(vlr_header) == 20:
+        user_id = vlr_header[2:18].rstrip(b'\0')
+        record_id, = struct.unpack_from('<H', vlr_header, 18)
+        if user_id == b'copc' and record_id == 1:
+            return 'readers.copc'
+    return 'readers.las'
+
+
+def _reader_from_extension(input_file):
+    """
+    Look up the PDAL reader for a point cloud file from its extension.
+
+    Args:
+        input_file (str): Path to the point cloud file.
+
+    Returns:
+        str: Name of the PDAL reader, or None if the extension is not supported.
 
     Example:
-        >>> _read_point_cloud("path/to/pointcloud.las", [{"type": "filters.sort", "dimension": "Z"}])
+        >>> _reader_from_extension("path/to/pointcloud.LAZ")
+        'readers.las'
     """
-    if not os.path.isfile(input_file):
-        raise FileNotFoundError(f"No such file: '{input_file}'")
+    path = PurePath(input_file)
+    compound_suffix = ''.join(path.suffixes[-2:]).lower()
+    return _READER_BY_EXTENSION.get(compound_suffix) or _READER_BY_EXTENSION.get(path.suffix.lower())
+
+
+def _get_reader(input_file):
+    """
+    Look up the PDAL reader for a point cloud file.
+
+    LAS files are recognised from their header, which also tells COPC files apart since they are often named
+    plain .laz. The reader is chosen from the extension only for files whose header cannot be read. This opens
+    the file, so callers determine the reader once per read and pass it on.
+
+    Args:
+        input_file (str): Path to the point cloud file.
+
+    Returns:
+        str: Name of the PDAL reader, or None if the file type is not supported.
+
+    Example:
+        >>> _get_reader("path/to/pointcloud.laz")
+        'readers.las'
+    """
+    return _reader_from_header(input_file) or _reader_from_extension(input_file)
+
+
+def _reader_stage(input_file, reader, **options):
+    """
+    Build the PDAL reader stage for a point cloud file.
+
+    Naming the reader explicitly spares PDAL from inferring the driver from the file name.
+
+    Args:
+        input_file (str): Path to the point cloud file.
+        reader (str): Name of the PDAL reader, as returned by `_get_reader`.
+        **options: Additional reader options, such as a `polygon` for readers.copc.
+
+    Returns:
+        dict or str: PDAL reader stage, or the bare file path if `reader` is None.
 
-    pipeline_def = {
-        "pipeline": [input_file] + pipeline_stages
+    Example:
+        >>> _reader_stage("path/to/pointcloud.las", "readers.las")
+        {'type': 'readers.las', 'filename': 'path/to/pointcloud.las'}
+    """
+    if reader is None:
+        return input_file
+    return {
+        "type": reader,
+        "filename": input_file,
+        **options
     }
 
-    pipeline_json = json.dumps(pipeline_def)
-    pipeline = pdal.Pipeline(pipeline_json)
+
+def _pdal_pipeline(pipeline_stages, arrays=()):
+    """
+    Construct a PDAL pipeline directly from stage definitions.
+
+    Passing a JSON string to `pdal.Pipeline` makes the bindings parse it back into `pdal.Stage` objects and then
+    serialise those to JSON again for libpdal. Building the stages directly skips that extra round trip; the
+    single serialisation done by the bindings themselves remains.
+
+    Args:
+        pipeline_stages (list): PDAL stage definitions as dictionaries. Strings are treated as reader file paths.
+        arrays (list, optional): List of NumPy arrays to use as the pipeline input. Defaults to ().
+
+    Returns:
+        pdal.Pipeline: PDAL Pipeline object, not yet executed.
+
+    Example:
+        >>> _pdal_pipeline(["path/to/pointcloud.las", {"type": "filters.sort", "dimension": "Z"}])
+    """
+    stages = [pdal.Reader(stage) if isinstance(stage, str) else pdal.Stage(**stage) for stage in pipeline_stages]
+    return pdal.Pipeline(stages, arrays=arrays)
+
+
+def _read_point_cloud(pipeline_stages):
+    """
+    Read a point cloud file using a PDAL pipeline.
+
+    Args:
+        pipeline_stages (list): PDAL pipeline stages, starting with the reader.
+
+    Returns:
+        pdal.Pipeline: PDAL Pipeline object containing the point cloud data.
+
+    Example:
+        >>> _read_point_cloud(["path/to/pointcloud.las", {"type": "filters.sort", "dimension": "Z"}])
+    """
+    pipeline = _pdal_pipeline(pipeline_stages)
     pipeline.execute()
     return pipeline
 
@@ -147,12 +306,7 @@ def _build_pdal_pipeline(arrays, pipeline_stages):
     Example:
         >>> _build_pdal_pipeline([array1, array2], [{"type": "filters.merge"}])
     """
-    pipeline_def = {
-        "pipeline": pipeline_stages
-    }
-
-    pipeline_json = json.dumps(pipeline_def)
-    pipeline = pdal.Pipeline(pipeline_json, arrays=arrays)
+    pipeline = _pdal_pipeline(pipeline_stages, arrays=arrays)
     pipeline.execute()
     return pipeline
 
@@ -174,18 +328,88 @@ def validate_crs(crs_list):
         >>> validate_crs(["EPSG:4326", "WGS84"])
         True
     """
+    # Identical representations match without parsing any of them. Unhashable inputs such as PROJJSON
+    # dictionaries cannot be compared this way and are always parsed.
+    if all(isinstance(crs, Hashable) for crs in crs_list) and len(set(crs_list)) <= 1:
+        return True
+
     simplified_crs_list = simplify_crs(crs_list)
     if not all(crs == simplified_crs_list[0] for crs in simplified_crs_list[1:]):
         raise ValueError("The CRS of the inputs do not match.")
     return True
 
 
-def read_lidar(input_file, thin_radius=None, hag=False, hag_dtm=False, dtm=None, crop_poly=False, poly=None):
+def _read_point_cloud_header(input_file, reader=None):
     """
-    Read LIDAR data and perform various preprocessing operations.
+    Read the summary information of a point cloud file from its header.
+
+    Only the header is parsed, so no point data is read or decompressed.
 
     Args:
         input_file (str): Path to the LIDAR file.
+        reader (str, optional): Name of the PDAL reader. Defaults to None, which looks it up with `_get_reader`.
+
+    Returns:
+        dict: PDAL quickinfo for the file, including its 'bounds', 'num_points' and 'srs'.
+
+    Raises:
+        ValueError: If the file type is not supported.
+
+    Example:
+        >>> _read_point_cloud_header("path/to/lidar.las")["bounds"]
+        {'maxx': 1.0, 'maxy': 1.0, 'maxz': 1.0, 'minx': 0.0, 'miny': 0.0, 'minz': 0.0}
+    """
+    reader = reader or _get_reader(input_file)
+    if reader is None:
+        raise ValueError("The input file must be a .las, .laz or .copc.laz file.")
+    quickinfo = _pdal_pipeline([_reader_stage(input_file, reader)]).quickinfo
+    return quickinfo[reader]
+
+
+def _header_crs(header):
+    """
+    Extract the spatial reference from point cloud header information.
+
+    Args:
+        header (dict): PDAL quickinfo for the file, as returned by `_read_point_cloud_header`.
+
+    Returns:
+        str: The compound WKT of the point cloud's spatial reference, or an empty string if the file has none.
+
+    Example:
+        >>> _header_crs(_read_point_cloud_header("path/to/lidar.las"))
+        'PROJCS["NAD83 / UTM zone 4N",...]'
+    """
+    # PDAL leaves the 'srs' entry out of quickinfo for files without a spatial reference.
+    return header.get("srs", {}).get("compoundwkt", "")
+
+
+def _read_point_cloud_crs(input_file, reader=None):
+    """
+    Read the spatial reference of a point cloud file from its header.
+
+    Args:
+        input_file (str): Path to the LIDAR file.
+        reader (str, optional): Name of the PDAL reader. Defaults to None, which looks it up with `_get_reader`.
+
+    Returns:
+        str: The compound WKT of the point cloud's spatial reference, or an empty string if the file has none.
+
+    Raises:
+        ValueError: If the file type is not supported.
+
+    Example:
+        >>> _read_point_cloud_crs("path/to/lidar.las")
+        'PROJCS["NAD83 / UTM zone 4N",...]'
+    """
+    return _header_crs(_read_point_cloud_header(input_file, reader))
+
+
+def _load_read_inputs(thin_radius=None, hag=False, hag_dtm=False, dtm=None, crop_poly=False, poly=None):
+    """
+    Validate the LIDAR read options and load the crop polygon and DTM CRS they refer to.
+
+    Args:
         thin_radius (float, optional): Radius for thinning filter. Defaults to None.
         hag (bool, optional): Whether to calculate Height Above Ground (HAG) using Delaunay triangulation. Defaults to False.
         hag_dtm (bool, optional): Whether to calculate HAG using a raster DTM. Defaults to False.
@@ -194,25 +418,24 @@ def read_lidar(input_file, thin_radius=None, hag=False, hag_dtm=False, dtm=None,
         poly (str, optional): Path to the polygon file for cropping. Defaults to None.
 
     Returns:
-        list: List of NumPy arrays containing the processed point cloud data.
+        tuple: A tuple containing the following:
+            - crop_shape (shapely.geometry.base.BaseGeometry): The crop polygon, or None if not cropping.
+            - crs_list (list): The CRS of the crop polygon and the DTM, which the point clouds must match.
 
     Raises:
-        FileNotFoundError: If the given file does not exist.
+        FileNotFoundError: If the polygon or DTM file does not exist.
         ValueError: For various types of invalid input.
 
     Example:
-        >>> read_lidar("path/to/lidar.las", thin_radius=1.5, hag=True)
+        >>> _load_read_inputs(hag_dtm=True, dtm="path/to/dtm.tif")
+        (None, ['EPSG:32604'])
     """
-    if not os.path.isfile(input_file):
-        raise FileNotFoundError(f"No such file: '{input_file}'")
-
-    if not input_file.lower().endswith(('.las', '.laz')):
-        raise ValueError("The input file must be a .las or .laz file.")
-
     if hag and hag_dtm:
         raise ValueError("Cannot use both 'hag' and 'hag_dtm' options at the same time.")
+    if thin_radius is not None and thin_radius <= 0:
+        raise ValueError("Thinning radius must be a positive number.")
 
-    pipeline_stages = []
+    crop_shape = None
     crs_list = []
 
     if crop_poly:
@@ -220,34 +443,263 @@ def read_lidar(input_file, thin_radius=None, hag=False, hag_dtm=False, dtm=None,
             raise FileNotFoundError(f"No such file: '{poly}'")
         polygon_wkt, crs_vector = load_polygon_from_file(poly)
         crs_list.append(crs_vector)
-        pipeline_stages.append(_crop_polygon(polygon_wkt))
-
-    if thin_radius is not None:
-        if thin_radius <= 0:
-            raise ValueError("Thinning radius must be a positive number.")
-        pipeline_stages.append(_filter_radius(thin_radius))
-
-    if hag:
-        pipeline_stages.append(_hag_delaunay)
+        crop_shape = wkt.loads(polygon_wkt)
 
     if hag_dtm:
         if not os.path.isfile(dtm):
             raise FileNotFoundError(f"No such file: '{dtm}'")
         if not dtm.lower().endswith('.tif'):
             raise ValueError("The DTM file must be a .tif file.")
-        crs_raster = get_raster_epsg(dtm)
-        crs_list.append(crs_raster)
-        pipeline_stages.append(_hag_raster(dtm))
+        crs_list.append(get_raster_epsg(dtm))
+
+    return crop_shape, crs_list
+
+
+def _reader_stages(input_file, reader, crop_shape=None):
+    """
+    Build the reader stage for a point cloud file, followed by a crop stage if one is needed.
+
+    COPC files are decoded on every core and cropped by the reader itself, which then only decodes the octree
+    nodes overlapping the polygon. Axis-aligned rectangles are cropped by bounds, which skips the point-in-polygon
+    test.
+
+    Args:
+        input_file (str): Path to the LIDAR file.
+        reader (str): Name of the PDAL reader, as returned by `_get_reader`.
+        crop_shape (shapely.geometry.base.BaseGeometry, optional): Polygon to crop the point cloud to.
+            Defaults to None.
+
+    Returns:
+        list: PDAL pipeline stages, starting with the reader.
+
+    Example:
+        >>> _reader_stages("path/to/lidar.las", "readers.las", box(0, 0, 10, 10))
+        [{'type': 'readers.las', 'filename': 'path/to/lidar.las'}, {'type': 'filters.crop', 'bounds': '([0.0, 10.0], [0.0, 10.0])'}]
+    """
+    is_copc = reader == 'readers.copc'
+    reader_options = {}
+    crop_stages = []
+
+    if is_copc:
+        # COPC nodes are compressed independently, so the reader can decode them on every core.
+        reader_options["threads"] = os.cpu_count() or 1
+
+    if crop_shape is not None:
+        is_rectangle = crop_shape.equals(crop_shape.envelope)
+        if is_copc:
+            if is_rectangle:
+                reader_options["bounds"] = _pdal_bounds(crop_shape.bounds)
+            else:
+                reader_options["polygon"] = crop_shape.wkt
+        elif is_rectangle:
+            crop_stages.append(_crop_bounds(crop_shape.bounds))
+        else:
+            crop_stages.append(_crop_polygon(crop_shape.wkt))
+
+    return [_reader_stage(input_file, reader, **reader_options)] + crop_stages
+
+
+def _build_read_stages(input_file, thin_radius=None, hag=False, hag_dtm=False, dtm=None, crop_poly=False, poly=None):
+    """
+    Validate the LIDAR read options and build the PDAL pipeline stages for reading the file.
+
+    The CRS of the point cloud, the DTM and the crop polygon are checked for consistency.
+
+    Args:
+        input_file (str): Path to the LIDAR file.
+        thin_radius (float, optional): Radius for thinning filter. Defaults to None.
+        hag (bool, optional): Whether to calculate Height Above Ground (HAG) using Delaunay triangulation. Defaults to False.
+        hag_dtm (bool, optional): Whether to calculate HAG using a raster DTM. Defaults to False.
+        dtm (str, optional): Path to the DTM file for HAG calculation. Defaults to None.
+        crop_poly (bool, optional): Whether to crop the point cloud using a polygon. Defaults to False.
+        poly (str, optional): Path to the polygon file for cropping. Defaults to None.
+
+    Returns:
+        list: PDAL pipeline stages, starting with the reader.
+
+    Raises:
+        FileNotFoundError: If the given file does not exist.
+        ValueError: For various types of invalid input.
+
+    Example:
+        >>> _build_read_stages("path/to/lidar.las", thin_radius=1.5)
+        [{'type': 'readers.las', 'filename': 'path/to/lidar.las'}, {'type': 'filters.sample', 'radius': 1.5}]
+    """
+    if not os.path.isfile(input_file):
+        raise FileNotFoundError(f"No such file: '{input_file}'")
+    reader = _get_reader(input_file)
+    if reader is None:
+        raise ValueError("The input file must be a .las, .laz or .copc.laz file.")
 
-    pipeline = _read_point_cloud(input_file, [{"type": "filters.info"}])
-    crs_pointcloud = pipeline.metadata["metadata"]["readers.las"]["comp_spatialreference"]
-    crs_list.append(crs_pointcloud)
-    # Validate CRS
+    crop_shape, crs_list = _load_read_inputs(thin_radius=thin_radius, hag=hag, hag_dtm=hag_dtm, dtm=dtm,
+                                             crop_poly=crop_poly, poly=poly)
+    crs_list.append(_read_point_cloud_crs(input_file, reader))
     validate_crs(crs_list)
 
-    pipeline = _read_point_cloud(input_file, pipeline_stages)
+    pipeline_stages = _reader_stages(input_file, reader, crop_shape)
+    if thin_radius is not None:
+        pipeline_stages.append(_filter_radius(thin_radius))
+    if hag:
+        pipeline_stages.append(_hag_delaunay())
+    if hag_dtm:
+        pipeline_stages.append(_hag_raster(dtm))
+
+    return pipeline_stages
+
+
+def read_lidar(input_file, thin_radius=None, hag=False, hag_dtm=False, dtm=None, crop_poly=False, poly=None):
+    """
+    Read LIDAR data and perform various preprocessing operations.
+
+    If the PYFORESTSCAN_CACHE_DIR environment variable is set, the processed point cloud is cached there and
+    reused by later calls with the same file and options. A cached read still checks the options and probes the
+    file header, but skips reading and processing the points.
+
+    Args:
+        input_file (str): Path to the LIDAR file.
+        thin_radius (float, optional): Radius for thinning filter. Defaults to None.
+        hag (bool, optional): Whether to calculate Height Above Ground (HAG) using Delaunay triangulation. Defaults to False.
+        hag_dtm (bool, optional): Whether to calculate HAG using a raster DTM. Defaults to False.
+        dtm (str, optional): Path to the DTM file for HAG calculation. Defaults to None.
+        crop_poly (bool, optional): Whether to crop the point cloud using a polygon. Defaults to False.
+        poly (str, optional): Path to the polygon file for cropping. Defaults to None.
 
-    return pipeline.arrays if pipeline.arrays else None
+    Returns:
+        list: List of NumPy arrays containing the processed point cloud data.
+
+    Raises:
+        FileNotFoundError: If the given file does not exist.
+        ValueError: For various types of invalid input.
+
+    Example:
+        >>> read_lidar("path/to/lidar.las", thin_radius=1.5, hag=True)
+    """
+    pipeline_stages = _build_read_stages(input_file, thin_radius=thin_radius, hag=hag, hag_dtm=hag_dtm, dtm=dtm,
+                                         crop_poly=crop_poly, poly=poly)
+
+    arrays = cached_pipeline(input_file, pipeline_stages,
+                             lambda: _read_point_cloud(pipeline_stages).arrays)
+    return arrays if arrays else None
+
+
+def read_lidar_many(input_files, thin_radius=None, hag=False, hag_dtm=False, dtm=None, crop_poly=False, poly=None):
+    """
+    Read several LIDAR tiles into a single point cloud with one PDAL pipeline.
+
+    Each tile is read and cropped on its own branch, then the branches are merged before thinning and Delaunay-based
+    HAG, so these see the whole area rather than one tile at a time. When cropping, tiles whose header bounds do not
+    intersect the polygon are skipped without being opened for reading.
+
+    Args:
+        input_files (list): Paths to the LIDAR files.
+        thin_radius (float, optional): Radius for thinning filter. Defaults to None.
+        hag (bool, optional): Whether to calculate Height Above Ground (HAG) using Delaunay triangulation. Defaults to False.
+        hag_dtm (bool, optional): Whether to calculate HAG using a raster DTM. Defaults to False.
+        dtm (str, optional): Path to the DTM file for HAG calculation. Defaults to None.
+        crop_poly (bool, optional): Whether to crop the point cloud using a polygon. Defaults to False.
+        poly (str, optional): Path to the polygon file for cropping. Defaults to None.
+
+    Returns:
+        list: List of NumPy arrays containing the processed point cloud data, or None if no points were read.
+
+    Raises:
+        FileNotFoundError: If a given file does not exist.
+        ValueError: For various types of invalid input.
+
+    Example:
+        >>> read_lidar_many(["path/to/tile1.laz", "path/to/tile2.laz"], hag=True, crop_poly=True, poly="path/to/plot.gpkg")
+    """
+    if not input_files:
+        raise ValueError("At least one input file is required.")
+    readers = []
+    for input_file in input_files:
+        if not os.path.isfile(input_file):
+            raise FileNotFoundError(f"No such file: '{input_file}'")
+        reader = _get_reader(input_file)
+        if reader is None:
+            raise ValueError(f"The input file must be a .las, .laz or .copc.laz file: '{input_file}'")
+        readers.append(reader)
+
+    # The polygon, the DTM CRS and each tile's reader and header are loaded once and shared by all stages.
+    crop_shape, crs_list = _load_read_inputs(thin_radius=thin_radius, hag=hag, hag_dtm=hag_dtm, dtm=dtm,
+                                             crop_poly=crop_poly, poly=poly)
+    headers = [_read_point_cloud_header(input_file, reader) for input_file, reader in zip(input_files, readers)]
+    validate_crs(crs_list + [_header_crs(header) for header in headers])
+
+    tiles = list(zip(input_files, readers))
+    if crop_shape is not None:
+        tiles = [
+            tile for tile, header in zip(tiles, headers)
+            if crop_shape.intersects(box(header["bounds"]["minx"], header["bounds"]["miny"],
+                                         header["bounds"]["maxx"], header["bounds"]["maxy"]))
+        ]
+        if not tiles:
+            return None
+
+    pipeline_stages = []
+    branch_tags = []
+    for index, (input_file, reader) in enumerate(tiles):
+        file_stages = _reader_stages(input_file, reader, crop_shape)
+        if hag_dtm:
+            file_stages.append(_hag_raster(dtm))
+        # Chain each tile's stages explicitly so that every branch ends up as an input of the merge.
+        previous_tag = None
+        for stage_index, stage in enumerate(file_stages):
+            tag = f"tile{index}_{stage_index}"
+            stage = {**stage, "tag": tag}
+            if previous_tag is not None:
+                stage["inputs"] = [previous_tag]
+            pipeline_stages.append(stage)
+            previous_tag = tag
+        branch_tags.append(previous_tag)
+
+    pipeline_stages.append({"type": "filters.merge", "inputs": branch_tags})
+    if thin_radius is not None:
+        pipeline_stages.append(_filter_radius(thin_radius))
+    if hag:
+        pipeline_stages.append(_hag_delaunay())
+
+    arrays = _read_point_cloud(pipeline_stages).arrays
+    return arrays if arrays else None
+
+
+def read_lidar_stream(input_file, chunk_size=1000000, thin_radius=None, hag_dtm=False, dtm=None, crop_poly=False,
+                      poly=None):
+    """
+    Read LIDAR data in chunks using PDAL's streaming mode.
+
+    Unlike `read_lidar`, the point cloud is never held in memory as a whole, so files larger than the
+    available memory can be processed. All stages must be streamable, which is why Delaunay-based HAG
+    is not available here; use `hag_dtm` instead.
+
+    Args:
+        input_file (str): Path to the LIDAR file.
+        chunk_size (int, optional): Maximum number of points per yielded array. Defaults to 1000000.
+        thin_radius (float, optional): Radius for thinning filter. Defaults to None.
+        hag_dtm (bool, optional): Whether to calculate HAG using a raster DTM. Defaults to False.
+        dtm (str, optional): Path to the DTM file for HAG calculation. Defaults to None.
+        crop_poly (bool, optional): Whether to crop the point cloud using a polygon. Defaults to False.
+        poly (str, optional): Path to the polygon file for cropping. Defaults to None.
+
+    Returns:
+        iterator: Iterator over NumPy arrays, each containing a chunk of the processed point cloud data.
+
+    Raises:
+        FileNotFoundError: If the given file does not exist.
+        ValueError: For various types of invalid input.
+
+    Example:
+        >>> for chunk in read_lidar_stream("path/to/lidar.laz", chunk_size=500000, hag_dtm=True, dtm="path/to/dtm.tif"):
+        ...     process(chunk)
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be a positive number.")
+
+    pipeline_stages = _build_read_stages(input_file, thin_radius=thin_radius, hag_dtm=hag_dtm, dtm=dtm,
+                                         crop_poly=crop_poly, poly=poly)
+
+    pipeline = _pdal_pipeline(pipeline_stages)
+    return pipeline.iterator(chunk_size=chunk_size)
 
 
 def write_las(arrays, output_file, compress=True):
@@ -276,42 +728,55 @@ def write_las(arrays, output_file, compress=True):
             raise ValueError("If 'compress' is False, output file must have a .las extension.")
         output_format = "writers.las"
 
-    pipeline_def = {
-        "pipeline": [
-            {
-                "type": output_format,
-                "filename": output_file
-            }
-        ]
-    }
+    pipeline_stages = [
+        {
+            "type": output_format,
+            "filename": output_file
+        }
+    ]
 
-    pipeline_json = json.dumps(pipeline_def)
-    pipeline = pdal.Pipeline(pipeline_json, arrays=arrays)
+    pipeline = _pdal_pipeline(pipeline_stages, arrays=arrays)
     pipeline.execute()
 
 
-def create_geotiff(layer, output_file, crs, spatial_extent):
+def create_geotiff(layer, output_file, crs, spatial_extent, dtype=None):
     """
-    Create a GeoTIFF file from a 2D NumPy array.
+    Create a tiled, DEFLATE-compressed GeoTIFF file from a 2D NumPy array.
 
     Args:
         layer (numpy.ndarray): 2D NumPy array containing raster data.
         output_file (str): Path to the output GeoTIFF file.
         crs (str): Coordinate Reference System for the output file.
         spatial_extent (tuple): Tuple containing the spatial extents (minx, miny, maxx, maxy).
+        dtype (str or np.dtype, optional): Data type of the output raster, e.g. 'float32' to halve the size of
+            float64 layers. Defaults to None, which keeps the data type of `layer`.
+
+    Raises:
+        ValueError: If `dtype` is not supported by GeoTIFF.
 
     Example:
         >>> create_geotiff(np.array([[1, 2], [3, 4]]), "path/to/output.tif", "EPSG:4326", (0, 0, 1, 1))
     """
+    dtype = np.dtype(layer.dtype if dtype is None else dtype)
+    if not rasterio.dtypes.check_dtype(dtype):
+        raise ValueError(f"Unsupported raster data type: '{dtype}'.")
+
     transform = rasterio.transform.from_bounds(spatial_extent[0], spatial_extent[2],
                                                spatial_extent[1], spatial_extent[3],
                                                layer.shape[1], layer.shape[0])
-
-    new_dataset = rasterio.open(output_file, 'w', driver='GTiff',
-                                height=layer.shape[0], width=layer.shape[1],
-                                count=1, dtype=str(layer.dtype),
-                                crs=crs,
-                                transform=transform)
-
-    new_dataset.write(layer, 1)
-    new_dataset.close()
+    # Differencing neighbouring pixels before DEFLATE shrinks smooth rasters; floats need the floating point predictor.
+    predictor = 3 if np.issubdtype(dtype, np.floating) else 2
+
+    with rasterio.open(output_file, 'w', driver='GTiff',
+                       height=layer.shape[0], width=layer.shape[1],
+                       count=1, dtype=dtype.name,
+                       crs=crs,
+                       transform=transform,
+                       tiled=True,
+                       blockxsize=_GEOTIFF_BLOCK_SIZE, blockysize=_GEOTIFF_BLOCK_SIZE,
+                       compress='deflate', predictor=predictor,
+                       num_threads='ALL_CPUS') as new_dataset:
+        # Writing whole tiles lets GDAL encode each block directly instead of staging the raster in its block cache.
+        # Casting per tile also avoids a full-size copy of the layer when the output type differs.
+        for _, window in new_dataset.block_windows(1):
+            new_dataset.write(layer[window.toslices()].astype(dtype, copy=False), 1, window=window)
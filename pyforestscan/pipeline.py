@@ -21,6 +21,46 @@ def _crop_polygon(polygon_wkt):
     }
 
 
+def _pdal_bounds(bounds):
+    """
+    Format a bounding box as a PDAL bounds string.
+
+    Args:
+        bounds (tuple): Bounding box as (xmin, ymin, xmax, ymax), as returned by shapely's `bounds`.
+
+    Returns:
+        str: Bounds in PDAL's "([xmin, xmax], [ymin, ymax])" format.
+
+    Example:
+        >>> _pdal_bounds((0, 0, 1, 1))
+        '([0, 1], [0, 1])'
+    """
+    xmin, ymin, xmax, ymax = bounds
+    return f"([{xmin}, {xmax}], [{ymin}, {ymax}])"
+
+
+def _crop_bounds(bounds):
+    """
+    Generate a PDAL crop filter configuration for an axis-aligned bounding box.
+
+    Cropping to bounds only compares coordinates, which is much cheaper than a point-in-polygon test.
+
+    Args:
+        bounds (tuple): Bounding box as (xmin, ymin, xmax, ymax).
+
+    Returns:
+        dict: PDAL crop filter configuration dictionary.
+
+    Example:
+        >>> _crop_bounds((0, 0, 1, 1))
+        {'type': 'filters.crop', 'bounds': '([0, 1], [0, 1])'}
+    """
+    return {
+        "type": "filters.crop",
+        "bounds": _pdal_bounds(bounds)
+    }
+
+
 def _hag_delaunay():
     """
     Generate a PDAL Height Above Ground (HAG) Delaunay filter configuration.
@@ -1,11 +1,38 @@
+import numpy as np
+
 from pyforestscan.handlers import _build_pdal_pipeline
 from pyforestscan.pipeline import _filter_hag
 
+
+def _hag_mask(arr, lower_limit=0, upper_limit=None):
+    """Build a boolean mask selecting points within the given Height Above Ground (HAG) limits.
+
+    Both limits are inclusive, matching PDAL's range filter.
+
+    Args:
+        arr (np.ndarray): NumPy structured array with a 'HeightAboveGround' field.
+        lower_limit (float, optional): Lower limit for Height Above Ground. Defaults to 0.
+        upper_limit (float, optional): Upper limit for Height Above Ground. If None, there is no upper limit. Defaults to None.
+
+    Returns:
+        np.ndarray: Boolean mask of the points to keep.
+
+    Example:
+        >>> kept = arr[_hag_mask(arr, lower_limit=1, upper_limit=5)]
+
+    """
+    hag = arr['HeightAboveGround']
+    mask = np.greater_equal(hag, lower_limit)
+    if upper_limit is not None:
+        np.logical_and(mask, np.less_equal(hag, upper_limit), out=mask)
+    return mask
+
+
 def filter_hag(arrays, lower_limit=0, upper_limit=None):
     """Filter a point cloud based on Height Above Ground (HAG) limits.
 
-    This function uses PDAL to filter a point cloud using the given lower and upper HAG limits.
-    The function leverages a pipeline for efficient filtering.
+    When every array already carries a 'HeightAboveGround' field, the points are selected directly with NumPy,
+    avoiding a round-trip through PDAL. Otherwise a PDAL range filter pipeline is used.
 
     Args:
         arrays (list): A list of NumPy structured arrays representing the point cloud.
@@ -20,5 +47,29 @@ def filter_hag(arrays, lower_limit=0, upper_limit=None):
         >>> filtered_arrays = filter_hag(original_arrays, lower_limit=1, upper_limit=5)
 
     """
-    pipeline = _build_pdal_pipeline(arrays, [_filter_hag(lower_limit, upper_limit)])
+    if all('HeightAboveGround' in (arr.dtype.names or ()) for arr in arrays):
+        return [arr[_hag_mask(arr, lower_limit, upper_limit)] for arr in arrays]
+
+    return run_filters(arrays, [_filter_hag(lower_limit, upper_limit)])
+
+
+def run_filters(arrays, pipeline_stages):
+    """Apply several PDAL filter stages to a point cloud in a single pipeline.
+
+    Each filter function in this module runs its own PDAL pipeline, so chaining them copies the point cloud
+    into and out of PDAL once per call. Passing all stages here executes them in one pipeline instead.
+
+    Args:
+        arrays (list): A list of NumPy structured arrays representing the point cloud.
+        pipeline_stages (list): PDAL stage definitions to apply in order, e.g. those built by `pyforestscan.pipeline`.
+
+    Returns:
+        list: A list of NumPy structured arrays representing the filtered point cloud.
+
+    Example:
+        >>> # Assume `original_arrays` is a list of NumPy structured arrays representing a point cloud.
+        >>> filtered_arrays = run_filters(original_arrays, [_filter_radius(0.5), _filter_hag(1, 5)])
+
+    """
+    pipeline = _build_pdal_pipeline(arrays, pipeline_stages)
     return pipeline.arrays
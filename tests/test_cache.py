@@ -0,0 +1,138 @@
+import os
+
+import numpy as np
+import pytest
+
+from pyforestscan.cache import CACHE_DIR_ENV, cached_pipeline
+
+POINT_DTYPE = [('X', 'f8'), ('Y', 'f8'), ('Z', 'f8'), ('Classification', 'u1')]
+STAGES = [{"type": "filters.sample", "radius": 1.5}]
+
+
+class _Pipeline:
+    """Counts runs of a fake pipeline returning one structured array."""
+
+    def __init__(self):
+        self.runs = 0
+        self.arrays = [np.array([(1.0, 2.0, 3.0, 2), (4.0, 5.0, 6.0, 5)], dtype=POINT_DTYPE)]
+
+    def __call__(self):
+        self.runs += 1
+        return self.arrays
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    path = tmp_path / "pointcloud.las"
+    path.write_bytes(b"points")
+    return str(path)
+
+
+def _cache_entries(cache_dir):
+    return [name for name in os.listdir(cache_dir) if name.endswith(".npz")]
+
+
+def test_miss_runs_pipeline_and_stores_result(tmp_path, input_file):
+    cache_dir = str(tmp_path / "cache")
+    pipeline = _Pipeline()
+
+    arrays = cached_pipeline(input_file, STAGES, pipeline, cache_dir)
+
+    assert pipeline.runs == 1
+    assert arrays is pipeline.arrays
+    assert len(_cache_entries(cache_dir)) == 1
+
+
+def test_hit_returns_stored_arrays_without_running_pipeline(tmp_path, input_file):
+    cache_dir = str(tmp_path / "cache")
+    pipeline = _Pipeline()
+    cached_pipeline(input_file, STAGES, pipeline, cache_dir)
+
+    arrays = cached_pipeline(input_file, STAGES, pipeline, cache_dir)
+
+    assert pipeline.runs == 1
+    assert len(arrays) == 1
+    assert arrays[0].dtype == pipeline.arrays[0].dtype
+    np.testing.assert_array_equal(arrays[0], pipeline.arrays[0])
+
+
+def test_cache_dir_from_environment(tmp_path, input_file, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    monkeypatch.setenv(CACHE_DIR_ENV, cache_dir)
+    pipeline = _Pipeline()
+
+    cached_pipeline(input_file, STAGES, pipeline)
+    cached_pipeline(input_file, STAGES, pipeline)
+
+    assert pipeline.runs == 1
+    assert len(_cache_entries(cache_dir)) == 1
+
+
+def test_no_cache_dir_always_runs_pipeline(input_file, monkeypatch):
+    monkeypatch.delenv(CACHE_DIR_ENV, raising=False)
+    pipeline = _Pipeline()
+
+    cached_pipeline(input_file, STAGES, pipeline)
+    cached_pipeline(input_file, STAGES, pipeline)
+
+    assert pipeline.runs == 2
+
+
+def test_changed_stages_miss(tmp_path, input_file):
+    cache_dir = str(tmp_path / "cache")
+    pipeline = _Pipeline()
+    cached_pipeline(input_file, STAGES, pipeline, cache_dir)
+
+    cached_pipeline(input_file, [{"type": "filters.sample", "radius": 3.0}], pipeline, cache_dir)
+
+    assert pipeline.runs == 2
+
+
+def test_modified_input_file_misses(tmp_path, input_file):
+    cache_dir = str(tmp_path / "cache")
+    pipeline = _Pipeline()
+    cached_pipeline(input_file, STAGES, pipeline, cache_dir)
+
+    with open(input_file, "ab") as f:
+        f.write(b" more points")
+    cached_pipeline(input_file, STAGES, pipeline, cache_dir)
+
+    assert pipeline.runs == 2
+
+
+def test_modified_referenced_file_misses(tmp_path, input_file):
+    cache_dir = str(tmp_path / "cache")
+    dtm = tmp_path / "dtm.tif"
+    dtm.write_bytes(b"dtm")
+    stages = [{"type": "filters.hag_dem", "raster": str(dtm)}]
+    pipeline = _Pipeline()
+    cached_pipeline(input_file, stages, pipeline, cache_dir)
+
+    dtm.write_bytes(b"new dtm")
+    cached_pipeline(input_file, stages, pipeline, cache_dir)
+
+    assert pipeline.runs == 2
+
+
+@pytest.mark.parametrize("contents", [b"", b"not a zip file", b"PK\x03\x04truncated"])
+def test_corrupt_entry_is_rewritten(tmp_path, input_file, contents):
+    cache_dir = str(tmp_path / "cache")
+    pipeline = _Pipeline()
+    cached_pipeline(input_file, STAGES, pipeline, cache_dir)
+    entry = os.path.join(cache_dir, _cache_entries(cache_dir)[0])
+    with open(entry, "wb") as f:
+        f.write(contents)
+
+    arrays = cached_pipeline(input_file, STAGES, pipeline, cache_dir)
+    cached = cached_pipeline(input_file, STAGES, pipeline, cache_dir)
+
+    assert pipeline.runs == 2
+    assert arrays is pipeline.arrays
+    np.testing.assert_array_equal(cached[0], pipeline.arrays[0])
+
+
+def test_empty_result_is_not_cached(tmp_path, input_file):
+    cache_dir = str(tmp_path / "cache")
+
+    assert cached_pipeline(input_file, STAGES, lambda: [], cache_dir) == []
+    assert not os.path.isdir(cache_dir) or not _cache_entries(cache_dir)
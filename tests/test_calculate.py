@@ -0,0 +1,158 @@
+import numpy as np
+import pytest
+
+from pyforestscan import calculate
+from pyforestscan.calculate import assign_voxels, calculate_lad, xyz_view
+
+POINT_DTYPE = [('X', 'f8'), ('Y', 'f8'), ('HeightAboveGround', 'f8')]
+
+
+def _histogramdd_voxels(arr, voxel_resolution, z_resolution):
+    """Reference binning with explicit bin edges, as assign_voxels originally did."""
+    edges = [
+        np.arange(arr[field].min(), arr[field].max() + resolution, resolution)
+        for field, resolution in (('X', voxel_resolution), ('Y', voxel_resolution),
+                                  ('HeightAboveGround', z_resolution))
+    ]
+    sample = np.column_stack((arr['X'], arr['Y'], arr['HeightAboveGround']))
+    histogram, _ = np.histogramdd(sample, bins=edges)
+    return histogram
+
+
+def test_assign_voxels_points_on_bin_edges_go_to_upper_bin():
+    arr = np.array([(0.3, 0.0, 0.0), (1.3, 0.0, 0.0), (2.3, 0.0, 0.0), (2.8, 0.0, 0.0)], dtype=POINT_DTYPE)
+
+    histogram, extent = assign_voxels(arr, 1, 1)
+
+    assert histogram[:, 0, 0].tolist() == [1, 1, 2]
+    assert extent == [0.3, 2.8, 0.0, 0.0]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_assign_voxels_matches_histogramdd_on_quantised_coordinates(seed):
+    rng = np.random.default_rng(seed)
+    arr = np.zeros(500, dtype=POINT_DTYPE)
+    for field in ('X', 'Y', 'HeightAboveGround'):
+        arr[field] = np.round(rng.uniform(0, 20, arr.size), 1)
+
+    histogram, _ = assign_voxels(arr, 1, 0.5)
+    expected = _histogramdd_voxels(arr, 1, 0.5)
+
+    assert histogram.shape == expected.shape
+    np.testing.assert_array_equal(histogram, expected)
+
+
+@pytest.mark.parametrize("kwargs, message", [
+    ({"out": np.empty((2, 3, 4), dtype=np.int32)}, "floating point dtype"),
+    ({"out": np.empty((4, 3, 2))}, "same shape"),
+    ({"out": np.empty((2, 3, 4, 2))[..., 0]}, "C-contiguous"),
+    ({"dtype": np.int32}, "floating point type"),
+])
+def test_calculate_lad_rejects_invalid_output(kwargs, message):
+    voxel_returns = np.ones((2, 3, 4))
+
+    with pytest.raises(ValueError, match=message):
+        calculate_lad(voxel_returns, 1, **kwargs)
+
+
+def test_calculate_lad_rejects_output_sharing_memory_with_input():
+    voxel_returns = np.ones((2, 3, 4))
+
+    with pytest.raises(ValueError, match="share memory"):
+        calculate_lad(voxel_returns, 1, out=voxel_returns)
+
+
+def _reference_lad(voxel_returns, voxel_height, beer_lambert_constant=1):
+    """Unblocked float64 LAD, computed over the whole grid at once."""
+    voxel_returns = np.asarray(voxel_returns, dtype=np.float64)
+    shots_in = np.cumsum(voxel_returns, axis=2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lad = np.log(shots_in / (shots_in - voxel_returns)) / (beer_lambert_constant * voxel_height)
+    lad[~np.isfinite(lad)] = np.nan
+    return lad
+
+
+def _voxel_returns(shape, seed=0):
+    return np.random.default_rng(seed).poisson(2, shape).astype(np.int32)
+
+
+@pytest.mark.parametrize("shape", [(5, 3, 4), (4, 4, 4), (1, 1, 7)])
+def test_calculate_lad_blocks_match_reference(monkeypatch, shape):
+    # Two float64 columns of four voxels per block, so (5, 3, 4) ends with a partial block.
+    monkeypatch.setattr(calculate, "_LAD_BLOCK_BYTES", 64)
+    voxel_returns = _voxel_returns(shape)
+
+    lad = calculate_lad(voxel_returns, 0.5, beer_lambert_constant=0.7, dtype=np.float64)
+
+    np.testing.assert_allclose(lad, _reference_lad(voxel_returns, 0.5, 0.7), equal_nan=True)
+
+
+def test_calculate_lad_default_block_size_matches_reference():
+    voxel_returns = _voxel_returns((70, 70, 50))
+
+    lad = calculate_lad(voxel_returns, 1)
+
+    assert lad.dtype == np.float32
+    np.testing.assert_allclose(lad, _reference_lad(voxel_returns, 1), rtol=1e-5, equal_nan=True)
+
+
+@pytest.mark.parametrize("shape", [(0, 3, 4), (3, 0, 4), (3, 3, 0)])
+def test_calculate_lad_empty_grids(shape):
+    lad = calculate_lad(np.zeros(shape, dtype=np.int32), 1)
+
+    assert lad.shape == shape
+
+
+def test_calculate_lad_reuses_output_buffer(monkeypatch):
+    monkeypatch.setattr(calculate, "_LAD_BLOCK_BYTES", 64)
+    out = np.full((5, 3, 4), -1.0)
+
+    for seed in range(3):
+        voxel_returns = _voxel_returns((5, 3, 4), seed)
+        lad = calculate_lad(voxel_returns, 1, out=out)
+
+        assert lad is out
+        np.testing.assert_allclose(lad, _reference_lad(voxel_returns, 1), equal_nan=True)
+
+
+def _points(dtype, n=4):
+    arr = np.zeros(n, dtype=dtype)
+    for offset, field in enumerate(('X', 'Y', 'Z')):
+        arr[field] = np.arange(n) + 10 * offset
+    return arr
+
+
+def test_xyz_view_is_zero_copy_for_adjacent_float64_fields():
+    arr = _points([('X', 'f8'), ('Y', 'f8'), ('Z', 'f8'), ('Intensity', 'u2'), ('Classification', 'u1')])
+
+    xyz = xyz_view(arr)
+
+    assert xyz.shape == (4, 3)
+    assert np.shares_memory(xyz, arr)
+    np.testing.assert_array_equal(xyz, np.column_stack((arr['X'], arr['Y'], arr['Z'])))
+    xyz[1, 2] = -1
+    assert arr['Z'][1] == -1
+
+
+def test_xyz_view_handles_fields_at_an_offset():
+    arr = _points([('Intensity', 'u2'), ('X', 'f8'), ('Y', 'f8'), ('Z', 'f8')])
+
+    xyz = xyz_view(arr)
+
+    assert np.shares_memory(xyz, arr)
+    np.testing.assert_array_equal(xyz, np.column_stack((arr['X'], arr['Y'], arr['Z'])))
+
+
+@pytest.mark.parametrize("arr", [
+    _points([('X', 'f4'), ('Y', 'f4'), ('Z', 'f4')]),
+    _points([('X', 'f8'), ('Z', 'f8'), ('Y', 'f8')]),
+    _points([('X', 'f8'), ('Y', 'f8'), ('Z', 'f8'), ('Intensity', 'u2')], n=8)[::2],
+    _points([('X', 'f8'), ('Y', 'f8'), ('Z', 'f8')], n=0),
+])
+def test_xyz_view_copies_other_layouts(arr):
+    xyz = xyz_view(arr)
+
+    assert xyz.shape == (arr.size, 3)
+    assert xyz.dtype == np.float64
+    assert not np.shares_memory(xyz, arr)
+    np.testing.assert_array_equal(xyz, np.column_stack((arr['X'], arr['Y'], arr['Z'])))
@@ -0,0 +1,65 @@
+import struct
+
+import pytest
+
+pytest.importorskip("pdal")
+
+from pyforestscan.handlers import _get_reader, _read_point_cloud_crs, read_lidar
+
+
+def _write_las_without_srs(path):
+    """Write a minimal LAS 1.2 file holding a single point and no VLRs, so it has no spatial reference."""
+    header = struct.pack(
+        '<4sHH16sBB32s32sHHHIIBHI5I3d3d6d',
+        b'LASF', 0, 0, b'\0' * 16, 1, 2, b'', b'', 1, 2024,
+        227, 227, 0, 0, 20, 1, 1, 0, 0, 0, 0,
+        0.01, 0.01, 0.01, 0.0, 0.0, 0.0,
+        1.0, 1.0, 2.0, 2.0, 3.0, 3.0,
+    )
+    point = struct.pack('<3iHBBbBH', 100, 200, 300, 0, 0, 0, 0, 0, 0)
+    path.write_bytes(header + point)
+    return str(path)
+
+
+def test_read_point_cloud_crs_without_srs(tmp_path):
+    las_file = _write_las_without_srs(tmp_path / "no_srs.las")
+
+    assert _read_point_cloud_crs(las_file) == ""
+
+
+def test_read_lidar_without_srs(tmp_path):
+    las_file = _write_las_without_srs(tmp_path / "no_srs.las")
+
+    arrays = read_lidar(las_file)
+
+    assert len(arrays) == 1
+    assert len(arrays[0]) == 1
+
+
+def _write_copc_header(path):
+    """Write a LAS header followed by the COPC info VLR header; enough for reader detection only."""
+    header = bytearray(375)
+    header[:4] = b'LASF'
+    struct.pack_into('<H', header, 94, 375)
+    vlr_header = struct.pack('<H16sHH32s', 0, b'copc', 1, 160, b'')
+    path.write_bytes(bytes(header) + vlr_header)
+    return str(path)
+
+
+def test_get_reader_follows_file_rewritten_in_place(tmp_path):
+    path = tmp_path / "tile.laz"
+
+    _write_las_without_srs(path)
+    assert _get_reader(str(path)) == 'readers.las'
+
+    _write_copc_header(path)
+    assert _get_reader(str(path)) == 'readers.copc'
+
+    _write_las_without_srs(path)
+    assert _get_reader(str(path)) == 'readers.las'
+
+
+def test_get_reader_uses_header_over_copc_extension(tmp_path):
+    las_file = _write_las_without_srs(tmp_path / "not_copc.copc.laz")
+
+    assert _get_reader(las_file) == 'readers.las'